@@ -5,6 +5,11 @@ Run ALL tests (basic + edge cases) with a single command.
 
 Usage:
     python run_all_tests.py
+    python run_all_tests.py --jobs 4    # run tests in 4 worker processes
+    python run_all_tests.py --jobs 0    # one worker process per CPU
+    python run_all_tests.py --fast      # basic tests only
+    python run_all_tests.py --durations 10   # list the 10 slowest tests
+    python run_all_tests.py --only search_max   # tests whose name matches
 
 This will execute:
 - 8 basic tests from test_gomoku_runner
@@ -17,7 +22,16 @@ Exit code 1 = one or more tests failed
 
 import sys
 import io
+import os
+import re
+import time
+import argparse
 import contextlib
+from typing import Optional
+from dataclasses import dataclass
+from itertools import chain
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 from gomoku import (
     make_empty_board,
@@ -37,10 +51,6 @@ from gomoku import (
 # TEST UTILITIES
 # ============================================================================
 
-failures = 0
-total_tests = 0
-
-
 def assert_true(cond, msg=None):
     if not cond:
         raise AssertionError(msg or 'Assertion failed')
@@ -51,19 +61,106 @@ def assert_equal(actual, expected, msg=None):
         raise AssertionError(msg or f'Expected {expected}, got {actual}')
 
 
-def run_test(fn, category=""):
-    global failures, total_tests
-    total_tests += 1
-    name = fn.__name__
+def cost(weight):
+    """Mark a test's relative run time (default 1) for parallel scheduling."""
+    def mark(fn):
+        fn._cost = weight
+        return fn
+    return mark
+
+
+def checkerboard(n, first='b', second='w'):
+    """Return n rows of alternating colours with `first` at (0, 0)."""
+    return [[first if (i + j) % 2 == 0 else second for j in range(n)] for i in range(n)]
+
+
+def fill_board(b, rows, empty=()):
+    """Copy `rows` into b cell by cell, then clear the `empty` cells."""
+    for i, row in enumerate(rows):
+        for j, cell in enumerate(row):
+            b[i][j] = cell
+    for y, x in empty:
+        b[y][x] = ' '
+
+
+def snapshot(b):
+    """Return an immutable, hashable copy of the board's contents."""
+    return tuple(map(tuple, b))
+
+
+# Shared full-board patterns, built once. fill_board copies them into each
+# test's own board, so the tests can never modify the shared patterns.
+# Checkerboard with the pattern reversed in the bottom half
+SPLIT_CHECKERBOARD = snapshot(checkerboard(8)[:4] + checkerboard(8, 'w', 'b')[4:])
+STRIPED_BOARD = snapshot([['b'] * 4 + ['w'] * 4, ['w'] * 4 + ['b'] * 4] * 4)
+ALL_BLACK_BOARD = snapshot([['b'] * 8] * 8)
+
+
+@dataclass
+class TestResult:
+    """Outcome of one test: name, category, error message (None if it passed) and run time."""
+    name: str
+    category: str = ""
+    error: Optional[str] = None
+    ns: int = 0
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def _safe_run(fn, category=""):
+    """Run one test and return its TestResult.
+
+    Only plain strings and ints cross the process boundary, so this is safe
+    to use from a process pool.
+    """
+    error = None
+    start = time.perf_counter_ns()
     try:
         fn()
-        print(f"✓ PASS: {name}")
-        return True
     except Exception as e:
-        failures += 1
-        print(f"✗ FAIL: {name}")
-        print(f"  └─ {e}")
-        return False
+        error = str(e)
+    return TestResult(fn.__name__, category, error, time.perf_counter_ns() - start)
+
+
+def _run_entry(entry):
+    return _safe_run(entry[1], entry[0])
+
+
+def format_result(result):
+    """Return the PASS/FAIL line(s) printed for one test result."""
+    if result.ok:
+        return f"✓ PASS: {result.name}"
+    return f"✗ FAIL: {result.name}\n  └─ {result.error}"
+
+
+def write_results(results):
+    """Write the PASS/FAIL lines for `results` to stdout in one call."""
+    if results:
+        sys.stdout.write("\n".join(map(format_result, results)) + "\n")
+        sys.stdout.flush()
+
+
+def run_tests(entries, jobs=1):
+    """Run (category, test) entries and yield their TestResults in order.
+
+    Serially, each result is yielded as soon as its test finishes. Every test
+    builds its own boards, so they are independent: with jobs > 1 the whole
+    table goes to one process pool at once, most expensive tests first
+    (longest-processing-time scheduling), so no worker is left running a
+    slow search_max test after the rest have finished.
+    """
+    if jobs <= 1:
+        for entry in entries:
+            yield _run_entry(entry)
+        return
+    order = sorted(range(len(entries)), key=lambda i: -getattr(entries[i][1], '_cost', 1))
+    results = [None] * len(entries)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for i, result in zip(order, pool.map(_run_entry, [entries[i] for i in order])):
+            results[i] = result
+    yield from results
 
 
 # ============================================================================
@@ -126,6 +223,7 @@ def test_score_and_win_conditions():
     assert_true(is_win(b2) == 'White won')
 
 
+@cost(20)
 def test_search_max_picks_winning_move_and_none_on_empty():
     b = make_empty_board(8)
     assert_true(search_max(b) == (4, 4))
@@ -148,12 +246,7 @@ def test_print_board_output():
 def test_continue_playing_and_draw():
     b = make_empty_board(8)
     # Fill with pattern that prevents any sequence of 5
-    for i in range(8):
-        for j in range(8):
-            if i < 4:
-                b[i][j] = 'b' if (i + j) % 2 == 0 else 'w'
-            else:
-                b[i][j] = 'w' if (i + j) % 2 == 0 else 'b'  # Reverse pattern in bottom half
+    fill_board(b, SPLIT_CHECKERBOARD)
     assert_true(is_win(b) == 'Draw')
 
 
@@ -364,12 +457,7 @@ def test_no_win_with_four():
 def test_draw_on_full_board_no_winner():
     b = make_empty_board(8)
     # Fill with pattern that prevents any sequence of 5
-    for i in range(8):
-        for j in range(8):
-            if i < 4:
-                b[i][j] = 'b' if (i + j) % 2 == 0 else 'w'
-            else:
-                b[i][j] = 'w' if (i + j) % 2 == 0 else 'b'  # Reverse pattern in bottom half
+    fill_board(b, SPLIT_CHECKERBOARD)
     assert_equal(is_win(b), 'Draw')
 
 
@@ -464,6 +552,7 @@ def test_score_semi_open_less_than_open():
 
 
 # search_max edge cases
+@cost(10)
 def test_search_max_empty_board():
     b = make_empty_board(8)
     assert_equal(search_max(b), (4, 4))
@@ -471,18 +560,13 @@ def test_search_max_empty_board():
 
 def test_search_max_one_empty_cell():
     b = make_empty_board(8)
-    for i in range(8):
-        for j in range(8):
-            if not (i == 3 and j == 3):
-                # Use rows of 4 max pattern to prevent accidental wins
-                if j < 4:
-                    b[i][j] = 'b' if i % 2 == 0 else 'w'
-                else:
-                    b[i][j] = 'w' if i % 2 == 0 else 'b'
+    # Use rows of 4 max pattern to prevent accidental wins
+    fill_board(b, STRIPED_BOARD, empty=[(3, 3)])
     y, x = search_max(b)
     assert_equal((y, x), (3, 3), f"With only one empty cell, should return (3,3), got ({y},{x})")
 
 
+@cost(30)
 def test_search_max_blocks_opponent_win():
     # Test 1: Block semi-open sequence of length 4
     b = make_empty_board(8)
@@ -515,6 +599,7 @@ def test_search_max_blocks_opponent_win():
                  f"Should block white's semi-open 3 at (7,3), got ({y3},{x3})")
 
 
+@cost(10)
 def test_search_max_takes_winning_move():
     b = make_empty_board(8)
     put_seq_on_board(b, 3, 1, 0, 1, 4, 'b')
@@ -522,6 +607,7 @@ def test_search_max_takes_winning_move():
     assert_true((y, x) in [(3, 0), (3, 5)], f"Should win at (3,0) or (3,5), got ({y},{x})")
 
 
+@cost(10)
 def test_search_max_prefers_winning_over_blocking():
     b = make_empty_board(8)
     put_seq_on_board(b, 0, 1, 0, 1, 4, 'b')
@@ -532,9 +618,7 @@ def test_search_max_prefers_winning_over_blocking():
 
 def test_search_max_full_board():
     b = make_empty_board(8)
-    for i in range(8):
-        for j in range(8):
-            b[i][j] = 'b'
+    fill_board(b, ALL_BLACK_BOARD)
     assert_equal(search_max(b), (None, None))
 
 
@@ -604,16 +688,16 @@ def test_is_bounded_surrounded_by_opponent():
 # put_seq_on_board edge cases
 def test_put_seq_length_zero():
     b = make_empty_board(8)
-    original = [row[:] for row in b]
+    original = snapshot(b)
     put_seq_on_board(b, 3, 3, 0, 1, 0, 'b')
-    assert_equal(b, original)
+    assert_equal(snapshot(b), original)
 
 
 def test_put_seq_length_one():
     b = make_empty_board(8)
     put_seq_on_board(b, 3, 3, 0, 1, 1, 'b')
     assert_equal(b[3][3], 'b')
-    count = sum(1 for row in b for cell in row if cell != ' ')
+    count = sum(len(row) - row.count(' ') for row in b)
     assert_equal(count, 1)
 
 
@@ -674,147 +758,244 @@ def test_fork_attack():
 
 def test_near_full_board():
     b = make_empty_board(8)
-    for i in range(8):
-        for j in range(8):
-            if not ((i == 4 and j == 4) or (i == 4 and j == 5)):
-                # Use rows of 4 max pattern to prevent accidental wins
-                if j < 4:
-                    b[i][j] = 'b' if i % 2 == 0 else 'w'
-                else:
-                    b[i][j] = 'w' if i % 2 == 0 else 'b'
+    # Use rows of 4 max pattern to prevent accidental wins
+    fill_board(b, STRIPED_BOARD, empty=[(4, 4), (4, 5)])
     
     assert_equal(is_win(b), 'Continue playing')
     y, x = search_max(b)
     assert_true((y, x) in [(4, 4), (4, 5)], f"Should suggest one of two empty cells, got ({y},{x})")
 
 
+# ============================================================================
+# TEST REGISTRY
+# ============================================================================
+
+BASIC_TESTS = (
+    test_make_and_is_empty,
+    test_put_seq_and_detects_vertical_open,
+    test_is_bounded_open_semi_closed,
+    test_detect_row_horizontal_and_diagonal,
+    test_score_and_win_conditions,
+    test_search_max_picks_winning_move_and_none_on_empty,
+    test_print_board_output,
+    test_continue_playing_and_draw,
+)
+
+EDGE_TESTS = (
+    # Board boundaries
+    test_sequence_at_top_left_corner,
+    test_sequence_at_bottom_right_corner,
+    test_sequence_at_all_four_corners,
+    test_sequence_along_top_edge,
+    test_sequence_along_left_edge,
+    test_sequence_along_bottom_edge,
+    test_sequence_along_right_edge,
+    test_diagonal_from_top_edge_to_right_edge,
+    test_diagonal_from_left_edge_to_bottom_edge,
+    
+    # Sequence detection
+    test_single_stone_no_sequence,
+    test_two_stones_not_adjacent,
+    test_exactly_five_in_a_row,
+    test_more_than_five_in_a_row,
+    test_overlapping_sequences,
+    test_parallel_sequences,
+    test_blocked_sequence_both_ends,
+    test_blocked_sequence_one_end,
+    test_blocked_by_same_color,
+    test_diagonal_negative_slope,
+    test_all_four_directions,
+    
+    # Win detection
+    test_win_with_five_horizontal,
+    test_win_with_five_vertical,
+    test_win_with_five_diagonal_positive,
+    test_win_with_five_diagonal_negative,
+    test_no_win_with_four,
+    test_draw_on_full_board_no_winner,
+    test_continue_playing_on_empty_board,
+    test_continue_playing_with_moves_but_no_five,
+    test_both_players_have_five_simultaneously,
+    
+    # Scoring
+    test_score_empty_board,
+    test_score_single_stone,
+    test_score_black_winning,
+    test_score_white_winning,
+    test_score_black_open_four,
+    test_score_white_open_four,
+    test_score_blocking_more_valuable,
+    test_score_multiple_open_threes,
+    test_score_semi_open_less_than_open,
+    
+    # search_max
+    test_search_max_empty_board,
+    test_search_max_one_empty_cell,
+    test_search_max_blocks_opponent_win,
+    test_search_max_takes_winning_move,
+    test_search_max_prefers_winning_over_blocking,
+    test_search_max_full_board,
+    
+    # detect_row specific
+    test_detect_row_entire_row_filled,
+    test_detect_row_alternating_colors,
+    test_detect_row_with_gaps,
+    test_detect_row_starts_mid_sequence,
+    
+    # is_bounded specific
+    test_is_bounded_length_one,
+    test_is_bounded_at_exact_board_boundary,
+    test_is_bounded_surrounded_by_empty,
+    test_is_bounded_surrounded_by_opponent,
+    
+    # put_seq_on_board
+    test_put_seq_length_zero,
+    test_put_seq_length_one,
+    test_put_seq_overwrites_existing,
+    
+    # Complex scenarios
+    test_complex_mid_game_position,
+    test_capture_pattern,
+    test_double_threat,
+    test_fork_attack,
+    test_near_full_board,
+)
+
+# Report sections as (category, header title, tests), in output order
+SECTIONS = (
+    ("basic", "BASIC TESTS", BASIC_TESTS),
+    ("edge", "EDGE CASE TESTS", EDGE_TESTS),
+)
+
+# Single dispatch table of (category, test) for the whole suite
+ALL_TESTS = tuple(chain.from_iterable(
+    ((category, t) for t in tests) for category, _, tests in SECTIONS
+))
+
+
 # ============================================================================
 # MAIN TEST RUNNER
 # ============================================================================
 
+def _jobs(text):
+    try:
+        jobs = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid job count {text!r}")
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(f"job count must be 0 or more, got {jobs}")
+    return jobs
+
+
+def _pattern(text):
+    try:
+        return re.compile(text)
+    except re.error as e:
+        raise argparse.ArgumentTypeError(f"invalid pattern {text!r}: {e}")
+
+
+def plural(n, noun="test"):
+    return f"{n} {noun}" if n == 1 else f"{n} {noun}s"
+
+
+def print_header(title):
+    print(f"🔹 {title}")
+    print("-" * 70)
+
+
+def render_sections(entries, results, stream=True):
+    """Print each section's header and PASS/FAIL lines, and return all results.
+
+    With stream=True every line is written as soon as its test finishes, so
+    a hanging test shows where the run stopped. Otherwise each section's
+    lines are written in one call.
+    """
+    counts = Counter(category for category, _ in entries)
+    titles = {category: title for category, title, _ in SECTIONS}
+    done, pending = [], []
+    for result in results:
+        if not done or result.category != done[-1].category:
+            write_results(pending)
+            pending = []
+            if done:
+                print()
+            print_header(f"{titles[result.category]} ({plural(counts[result.category])})")
+        done.append(result)
+        if stream:
+            write_results([result])
+        else:
+            pending.append(result)
+    write_results(pending)
+    return done
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Gomoku test suite.")
+    parser.add_argument(
+        "-j", "--jobs", type=_jobs, default=1,
+        help="number of worker processes (0 = one per CPU, default: 1)",
+    )
+    parser.add_argument(
+        "--fast", action="store_true",
+        help="run only the basic tests and skip the edge cases",
+    )
+    parser.add_argument(
+        "--durations", type=int, default=0, metavar="N",
+        help="after the results, list the N slowest tests",
+    )
+    parser.add_argument(
+        "--only", type=_pattern, metavar="PATTERN",
+        help="run only tests whose name matches this regular expression",
+    )
+    return parser.parse_args(argv)
+
+
 def main():
+    args = parse_args()
+    jobs = args.jobs or os.cpu_count() or 1
+
+    entries = ALL_TESTS
+    if args.fast:
+        entries = tuple(e for e in entries if e[0] == "basic")
+    if args.only:
+        entries = tuple(e for e in entries if args.only.search(e[1].__name__))
+    if not entries:
+        filters = ["--fast"] if args.fast else []
+        if args.only:
+            filters.append(f"--only {args.only.pattern!r}")
+        print(f"No tests selected by {' '.join(filters)}")
+        sys.exit(1)
+
     print("=" * 70)
     print("GOMOKU COMPREHENSIVE TEST SUITE")
     print("=" * 70)
     print()
+
+    # Serial runs report each test as it finishes; pool runs report per section
+    results = render_sections(entries, run_tests(entries, jobs), stream=jobs <= 1)
     
-    # Basic tests
-    print("🔹 BASIC TESTS (8 tests)")
-    print("-" * 70)
-    basic_tests = [
-        test_make_and_is_empty,
-        test_put_seq_and_detects_vertical_open,
-        test_is_bounded_open_semi_closed,
-        test_detect_row_horizontal_and_diagonal,
-        test_score_and_win_conditions,
-        test_search_max_picks_winning_move_and_none_on_empty,
-        test_print_board_output,
-        test_continue_playing_and_draw,
-    ]
-    
-    for test in basic_tests:
-        run_test(test)
-    
-    print()
-    print("🔹 EDGE CASE TESTS (60 tests)")
-    print("-" * 70)
-    
-    # Edge case tests
-    edge_tests = [
-        # Board boundaries
-        test_sequence_at_top_left_corner,
-        test_sequence_at_bottom_right_corner,
-        test_sequence_at_all_four_corners,
-        test_sequence_along_top_edge,
-        test_sequence_along_left_edge,
-        test_sequence_along_bottom_edge,
-        test_sequence_along_right_edge,
-        test_diagonal_from_top_edge_to_right_edge,
-        test_diagonal_from_left_edge_to_bottom_edge,
-        
-        # Sequence detection
-        test_single_stone_no_sequence,
-        test_two_stones_not_adjacent,
-        test_exactly_five_in_a_row,
-        test_more_than_five_in_a_row,
-        test_overlapping_sequences,
-        test_parallel_sequences,
-        test_blocked_sequence_both_ends,
-        test_blocked_sequence_one_end,
-        test_blocked_by_same_color,
-        test_diagonal_negative_slope,
-        test_all_four_directions,
-        
-        # Win detection
-        test_win_with_five_horizontal,
-        test_win_with_five_vertical,
-        test_win_with_five_diagonal_positive,
-        test_win_with_five_diagonal_negative,
-        test_no_win_with_four,
-        test_draw_on_full_board_no_winner,
-        test_continue_playing_on_empty_board,
-        test_continue_playing_with_moves_but_no_five,
-        test_both_players_have_five_simultaneously,
-        
-        # Scoring
-        test_score_empty_board,
-        test_score_single_stone,
-        test_score_black_winning,
-        test_score_white_winning,
-        test_score_black_open_four,
-        test_score_white_open_four,
-        test_score_blocking_more_valuable,
-        test_score_multiple_open_threes,
-        test_score_semi_open_less_than_open,
-        
-        # search_max
-        test_search_max_empty_board,
-        test_search_max_one_empty_cell,
-        test_search_max_blocks_opponent_win,
-        test_search_max_takes_winning_move,
-        test_search_max_prefers_winning_over_blocking,
-        test_search_max_full_board,
-        
-        # detect_row specific
-        test_detect_row_entire_row_filled,
-        test_detect_row_alternating_colors,
-        test_detect_row_with_gaps,
-        test_detect_row_starts_mid_sequence,
-        
-        # is_bounded specific
-        test_is_bounded_length_one,
-        test_is_bounded_at_exact_board_boundary,
-        test_is_bounded_surrounded_by_empty,
-        test_is_bounded_surrounded_by_opponent,
-        
-        # put_seq_on_board
-        test_put_seq_length_zero,
-        test_put_seq_length_one,
-        test_put_seq_overwrites_existing,
-        
-        # Complex scenarios
-        test_complex_mid_game_position,
-        test_capture_pattern,
-        test_double_threat,
-        test_fork_attack,
-        test_near_full_board,
-    ]
-    
-    for test in edge_tests:
-        run_test(test)
-    
+    # Slowest tests
+    if args.durations > 0:
+        slowest = sorted(results, key=lambda r: r.ns, reverse=True)[:args.durations]
+        print()
+        print_header(f"SLOWEST TESTS (top {len(slowest)})")
+        sys.stdout.write("".join(f"{r.ns / 1e6:8.2f}ms  {r.name}\n" for r in slowest))
+
     # Summary
     print()
     print("=" * 70)
-    passed = total_tests - failures
+    outcomes = Counter("passed" if r.ok else "failed" for r in results)
+    passed, failures = outcomes["passed"], outcomes["failed"]
+    total_tests = passed + failures
     pass_rate = (passed / total_tests * 100) if total_tests > 0 else 0
     
     if failures == 0:
-        print(f"✅ SUCCESS! All {total_tests} tests PASSED! 🎉")
+        print(f"✅ SUCCESS! All {plural(total_tests)} PASSED! 🎉")
     else:
         print(f"⚠️  RESULTS: {passed}/{total_tests} tests passed ({pass_rate:.1f}%)")
         print(f"❌ {failures} test(s) FAILED")
-    
+    if args.fast:
+        print(f"(skipped {len(EDGE_TESTS)} edge tests; omit --fast to run all)")
     print("=" * 70)
     
     sys.exit(0 if failures == 0 else 1)
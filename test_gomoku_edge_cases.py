@@ -39,6 +39,31 @@ def assert_equal(actual, expected, msg=None):
         raise AssertionError(msg or f'Expected {expected}, got {actual}')
 
 
+def checkerboard(n, first='b', second='w'):
+    """Return n rows of alternating colours with `first` at (0, 0)."""
+    return [[first if (i + j) % 2 == 0 else second for j in range(n)] for i in range(n)]
+
+
+def fill_board(b, rows, empty=()):
+    """Copy `rows` into b cell by cell, then clear the `empty` cells."""
+    for i, row in enumerate(rows):
+        for j, cell in enumerate(row):
+            b[i][j] = cell
+    for y, x in empty:
+        b[y][x] = ' '
+
+
+def snapshot(b):
+    """Return an immutable, hashable copy of the board's contents."""
+    return tuple(map(tuple, b))
+
+
+# Shared full-board patterns, built once. fill_board copies them into each
+# test's own board, so the tests can never modify the shared patterns.
+CHECKERBOARD = snapshot(checkerboard(8))
+ALL_BLACK_BOARD = snapshot([['b'] * 8] * 8)
+
+
 def run_test(fn):
     global failures
     name = fn.__name__
@@ -308,9 +333,7 @@ def test_draw_on_full_board_no_winner():
     """Test draw when board is full with no winner"""
     b = make_empty_board(8)
     # Fill board in checkerboard pattern (prevents 5 in a row)
-    for i in range(8):
-        for j in range(8):
-            b[i][j] = 'b' if (i + j) % 2 == 0 else 'w'
+    fill_board(b, CHECKERBOARD)
     assert_equal(is_win(b), 'Draw')
 
 
@@ -435,10 +458,7 @@ def test_search_max_empty_board():
 def test_search_max_one_empty_cell():
     """Board with one empty cell should return that cell"""
     b = make_empty_board(8)
-    for i in range(8):
-        for j in range(8):
-            if not (i == 3 and j == 3):
-                b[i][j] = 'b' if (i + j) % 2 == 0 else 'w'
+    fill_board(b, CHECKERBOARD, empty=[(3, 3)])
     # Only (3,3) is empty - search_max should return it as the only legal move
     y, x = search_max(b)
     assert_equal((y, x), (3, 3), f"With only one empty cell, should return (3,3), got ({y},{x})")
@@ -479,9 +499,7 @@ def test_search_max_prefers_winning_over_blocking():
 def test_search_max_full_board():
     """Full board should return (None, None)"""
     b = make_empty_board(8)
-    for i in range(8):
-        for j in range(8):
-            b[i][j] = 'b'
+    fill_board(b, ALL_BLACK_BOARD)
     assert_equal(search_max(b), (None, None))
 
 
@@ -577,10 +595,10 @@ def test_is_bounded_surrounded_by_opponent():
 def test_put_seq_length_zero():
     """Test put_seq_on_board with length 0"""
     b = make_empty_board(8)
-    original = [row[:] for row in b]
+    original = snapshot(b)
     put_seq_on_board(b, 3, 3, 0, 1, 0, 'b')
     # Board should be unchanged
-    assert_equal(b, original)
+    assert_equal(snapshot(b), original)
 
 
 def test_put_seq_length_one():
@@ -589,7 +607,7 @@ def test_put_seq_length_one():
     put_seq_on_board(b, 3, 3, 0, 1, 1, 'b')
     assert_equal(b[3][3], 'b')
     # Only one cell should be filled
-    count = sum(1 for row in b for cell in row if cell != ' ')
+    count = sum(len(row) - row.count(' ') for row in b)
     assert_equal(count, 1)
 
 
@@ -672,10 +690,7 @@ def test_near_full_board():
     """Test behavior when board is almost full"""
     b = make_empty_board(8)
     # Fill all but 2 cells
-    for i in range(8):
-        for j in range(8):
-            if not ((i == 4 and j == 4) or (i == 4 and j == 5)):
-                b[i][j] = 'b' if (i + j) % 2 == 0 else 'w'
+    fill_board(b, CHECKERBOARD, empty=[(4, 4), (4, 5)])
     
     # Should still be playing
     assert_equal(is_win(b), 'Continue playing')
@@ -688,99 +703,100 @@ def test_near_full_board():
 # RUN ALL TESTS
 # ============================================================================
 
-def main():
-    tests = [
-        # Board boundary tests
-        test_sequence_at_top_left_corner,
-        test_sequence_at_bottom_right_corner,
-        test_sequence_at_all_four_corners,
-        test_sequence_along_top_edge,
-        test_sequence_along_left_edge,
-        test_sequence_along_bottom_edge,
-        test_sequence_along_right_edge,
-        test_diagonal_from_top_edge_to_right_edge,
-        test_diagonal_from_left_edge_to_bottom_edge,
-        
-        # Sequence detection edge cases
-        test_single_stone_no_sequence,
-        test_two_stones_not_adjacent,
-        test_exactly_five_in_a_row,
-        test_more_than_five_in_a_row,
-        test_overlapping_sequences,
-        test_parallel_sequences,
-        test_blocked_sequence_both_ends,
-        test_blocked_sequence_one_end,
-        test_blocked_by_same_color,
-        test_diagonal_negative_slope,
-        test_all_four_directions,
-        
-        # Win detection edge cases
-        test_win_with_five_horizontal,
-        test_win_with_five_vertical,
-        test_win_with_five_diagonal_positive,
-        test_win_with_five_diagonal_negative,
-        test_no_win_with_four,
-        test_draw_on_full_board_no_winner,
-        test_continue_playing_on_empty_board,
-        test_continue_playing_with_moves_but_no_five,
-        test_both_players_have_five_simultaneously,
-        
-        # Scoring edge cases
-        test_score_empty_board,
-        test_score_single_stone,
-        test_score_black_winning,
-        test_score_white_winning,
-        test_score_black_open_four,
-        test_score_white_open_four,
-        test_score_blocking_more_valuable,
-        test_score_multiple_open_threes,
-        test_score_semi_open_less_than_open,
-        
-        # search_max edge cases
-        test_search_max_empty_board,
-        test_search_max_one_empty_cell,
-        test_search_max_blocks_opponent_win,
-        test_search_max_takes_winning_move,
-        test_search_max_prefers_winning_over_blocking,
-        test_search_max_full_board,
-        
-        # detect_row specific edge cases
-        test_detect_row_entire_row_filled,
-        test_detect_row_alternating_colors,
-        test_detect_row_with_gaps,
-        test_detect_row_starts_mid_sequence,
-        
-        # is_bounded specific edge cases
-        test_is_bounded_length_one,
-        test_is_bounded_at_exact_board_boundary,
-        test_is_bounded_surrounded_by_empty,
-        test_is_bounded_surrounded_by_opponent,
-        
-        # put_seq_on_board edge cases
-        test_put_seq_length_zero,
-        test_put_seq_length_one,
-        test_put_seq_overwrites_existing,
-        
-        # Complex game scenarios
-        test_complex_mid_game_position,
-        test_capture_pattern,
-        test_double_threat,
-        test_fork_attack,
-        test_near_full_board,
-    ]
+TESTS = (
+    # Board boundary tests
+    test_sequence_at_top_left_corner,
+    test_sequence_at_bottom_right_corner,
+    test_sequence_at_all_four_corners,
+    test_sequence_along_top_edge,
+    test_sequence_along_left_edge,
+    test_sequence_along_bottom_edge,
+    test_sequence_along_right_edge,
+    test_diagonal_from_top_edge_to_right_edge,
+    test_diagonal_from_left_edge_to_bottom_edge,
+    
+    # Sequence detection edge cases
+    test_single_stone_no_sequence,
+    test_two_stones_not_adjacent,
+    test_exactly_five_in_a_row,
+    test_more_than_five_in_a_row,
+    test_overlapping_sequences,
+    test_parallel_sequences,
+    test_blocked_sequence_both_ends,
+    test_blocked_sequence_one_end,
+    test_blocked_by_same_color,
+    test_diagonal_negative_slope,
+    test_all_four_directions,
+    
+    # Win detection edge cases
+    test_win_with_five_horizontal,
+    test_win_with_five_vertical,
+    test_win_with_five_diagonal_positive,
+    test_win_with_five_diagonal_negative,
+    test_no_win_with_four,
+    test_draw_on_full_board_no_winner,
+    test_continue_playing_on_empty_board,
+    test_continue_playing_with_moves_but_no_five,
+    test_both_players_have_five_simultaneously,
+    
+    # Scoring edge cases
+    test_score_empty_board,
+    test_score_single_stone,
+    test_score_black_winning,
+    test_score_white_winning,
+    test_score_black_open_four,
+    test_score_white_open_four,
+    test_score_blocking_more_valuable,
+    test_score_multiple_open_threes,
+    test_score_semi_open_less_than_open,
+    
+    # search_max edge cases
+    test_search_max_empty_board,
+    test_search_max_one_empty_cell,
+    test_search_max_blocks_opponent_win,
+    test_search_max_takes_winning_move,
+    test_search_max_prefers_winning_over_blocking,
+    test_search_max_full_board,
+    
+    # detect_row specific edge cases
+    test_detect_row_entire_row_filled,
+    test_detect_row_alternating_colors,
+    test_detect_row_with_gaps,
+    test_detect_row_starts_mid_sequence,
     
-    print(f"Running {len(tests)} edge case tests...\n")
+    # is_bounded specific edge cases
+    test_is_bounded_length_one,
+    test_is_bounded_at_exact_board_boundary,
+    test_is_bounded_surrounded_by_empty,
+    test_is_bounded_surrounded_by_opponent,
+    
+    # put_seq_on_board edge cases
+    test_put_seq_length_zero,
+    test_put_seq_length_one,
+    test_put_seq_overwrites_existing,
+    
+    # Complex game scenarios
+    test_complex_mid_game_position,
+    test_capture_pattern,
+    test_double_threat,
+    test_fork_attack,
+    test_near_full_board,
+)
+
+
+def main():
+    print(f"Running {len(TESTS)} edge case tests...\n")
     
-    for t in tests:
+    for t in TESTS:
         run_test(t)
     
     print(f"\n{'='*70}")
     if failures:
-        print(f"RESULT: {failures} test(s) FAILED out of {len(tests)} total")
+        print(f"RESULT: {failures} test(s) FAILED out of {len(TESTS)} total")
         print(f"{'='*70}")
         sys.exit(1)
     else:
-        print(f"RESULT: All {len(tests)} tests PASSED! ✓")
+        print(f"RESULT: All {len(TESTS)} tests PASSED! ✓")
         print(f"{'='*70}")
         sys.exit(0)
 
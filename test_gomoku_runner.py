@@ -129,19 +129,20 @@ def test_continue_playing_and_draw():
     assert_true(is_win(b2) == 'Draw')
 
 
+TESTS = (
+    test_make_and_is_empty,
+    test_put_seq_and_detects_vertical_open,
+    test_is_bounded_open_semi_closed,
+    test_detect_row_horizontal_and_diagonal,
+    test_score_and_win_conditions,
+    test_search_max_picks_winning_move_and_none_on_empty,
+    test_print_board_output,
+    test_continue_playing_and_draw,
+)
+
+
 def main():
-    tests = [
-        test_make_and_is_empty,
-        test_put_seq_and_detects_vertical_open,
-        test_is_bounded_open_semi_closed,
-        test_detect_row_horizontal_and_diagonal,
-        test_score_and_win_conditions,
-        test_search_max_picks_winning_move_and_none_on_empty,
-        test_print_board_output,
-        test_continue_playing_and_draw,
-    ]
-
-    for t in tests:
+    for t in TESTS:
         run_test(t)
 
     if failures: